@@ -24,11 +24,17 @@ class GameConfig:
         """
         Initialize GameConfig with optional config file path.
 
+        If the file does not exist yet, it is created with the default
+        configuration, so any unused path (for example inside a temporary
+        directory) is enough to get a fresh default config.
+
         Args:
             config_file: Path to JSON configuration file
         """
         self.config_file = config_file
         self.config = self._get_default_config()
+        # Bumped on every change so users (like the wheel) can tell when to refresh
+        self.version = 0
         self.load_config()
 
     def _get_default_config(self) -> Dict[str, Any]:
@@ -68,6 +74,7 @@ class GameConfig:
                     loaded_config = json.load(f)
                     # Merge with defaults to ensure all keys exist
                     self.config.update(loaded_config)
+                    self.version += 1
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error loading config file: {e}")
                 print("Using default configuration.")
@@ -85,6 +92,18 @@ class GameConfig:
         except IOError as e:
             print(f"Error saving config file: {e}")
 
+    def _update(self, key: str, value: Any) -> None:
+        """
+        Set one configuration value, bump the version and save.
+
+        Args:
+            key: Configuration key to set
+            value: New (already validated) value
+        """
+        self.config[key] = value
+        self.version += 1
+        self.save_config()
+
     def get_config(self) -> Dict[str, Any]:
         """
         Get current configuration.
@@ -127,8 +146,7 @@ class GameConfig:
         """
         if not teams or len(teams) < 2:
             raise ValueError("Must have at least 2 teams")
-        self.config["teams"] = teams
-        self.save_config()
+        self._update("teams", teams)
 
     def update_starting_points(self, points: int) -> None:
         """
@@ -139,8 +157,7 @@ class GameConfig:
         """
         if points < 0:
             raise ValueError("Starting points must be >= 0")
-        self.config["starting_points"] = points
-        self.save_config()
+        self._update("starting_points", points)
 
     def update_max_points(self, points: int) -> None:
         """
@@ -151,8 +168,7 @@ class GameConfig:
         """
         if points < 0:
             raise ValueError("Maximum points must be >= 0")
-        self.config["max_points"] = points
-        self.save_config()
+        self._update("max_points", points)
 
     def update_max_rounds(self, rounds: int) -> None:
         """
@@ -163,8 +179,7 @@ class GameConfig:
         """
         if rounds <= 0:
             raise ValueError("Maximum rounds must be > 0")
-        self.config["max_rounds"] = rounds
-        self.save_config()
+        self._update("max_rounds", rounds)
 
     def update_starting_round(self, round_num: int) -> None:
         """
@@ -175,8 +190,7 @@ class GameConfig:
         """
         if round_num <= 0:
             raise ValueError("Starting round must be > 0")
-        self.config["starting_round"] = round_num
-        self.save_config()
+        self._update("starting_round", round_num)
 
     def update_wheel_options(self, wheel_options: List[Dict[str, Any]]) -> None:
         """
@@ -197,8 +211,7 @@ class GameConfig:
             if option["weight"] <= 0:
                 raise ValueError("Wheel option weights must be > 0")
 
-        self.config["wheel_options"] = wheel_options
-        self.save_config()
+        self._update("wheel_options", wheel_options)
 
     def display_config(self) -> str:
         """
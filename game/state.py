@@ -10,16 +10,110 @@ This module handles the current state of an active game including:
 
 import json
 import os
+from collections import defaultdict
+from itertools import count
 from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson  # Optional: much faster saving and loading
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Pass as state_file to keep a game in memory only (nothing is saved)
+MEMORY_STATE_FILE = ":memory:"
+
+
+def _write_json(data: Dict, path: str) -> None:
+    """Write data to a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+
+def _read_json(path: str) -> Dict:
+    """
+    Read a JSON file, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+            (orjson's error is a subclass of it)
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Shared by all game states and score dictionaries, so a version is never reused
+_state_versions = count()
+
+
+class _ScoreDict(dict):
+    """
+    Team -> score dictionary that knows when it was last changed.
+
+    Every change gives it a new, never reused version number, which
+    feeds into GameState.version.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = next(_state_versions)
+
+    def _changed(self) -> None:
+        self.version = next(_state_versions)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._changed()
+        return result
+
+
+@dataclass(slots=True)
 class GameEvent:
     """
     Represents a single event that occurred during the game.
 
+    Uses __slots__ so the event history of a long game stays small in memory.
+
     Attributes:
         timestamp: When the event occurred
         round_number: Which round this event happened in
@@ -54,7 +148,8 @@ class GameState:
             teams: List of team names
             starting_points: Initial points for each team
             starting_round: Starting round number
-            state_file: Path to save game state
+            state_file: Path to save game state, or MEMORY_STATE_FILE
+                (":memory:") to never write the game to disk
         """
         self.state_file = state_file
         self.teams = teams
@@ -68,6 +163,52 @@ class GameState:
         # Save initial state
         self.save_state()
 
+    @property
+    def version(self) -> int:
+        """
+        Number that changes whenever the game changes.
+
+        Covers the scores (including direct writes like scores["Red"] = 0),
+        the round, the turn and events added through this class. Code that
+        caches results based on the game (like GameWheel) compares this one
+        integer to know when to work them out again.
+        """
+        # Both come from the same ever-increasing counter, so the newest wins
+        return max(self._version, self._scores.version)
+
+    def _changed(self) -> None:
+        """Give the game a new version."""
+        self._version = next(_state_versions)
+
+    @property
+    def scores(self) -> Dict[str, int]:
+        """Team -> score dictionary; has a version that changes on every update."""
+        return self._scores
+
+    @scores.setter
+    def scores(self, scores: Dict[str, int]) -> None:
+        self._scores = _ScoreDict(scores)
+
+    @property
+    def current_round(self) -> int:
+        """Current round number."""
+        return self._current_round
+
+    @current_round.setter
+    def current_round(self, round_number: int) -> None:
+        self._current_round = round_number
+        self._changed()
+
+    @property
+    def current_turn_index(self) -> int:
+        """Index into teams of the team whose turn it is."""
+        return self._current_turn_index
+
+    @current_turn_index.setter
+    def current_turn_index(self, index: int) -> None:
+        self._current_turn_index = index
+        self._changed()
+
     def get_current_team(self) -> str:
         """
         Get the team whose turn it currently is.
@@ -112,6 +253,38 @@ class GameState:
         """
         return self.scores.copy()
 
+    def score_of(self, team: str) -> int:
+        """
+        Get one team's score without copying the whole scores dictionary.
+
+        Args:
+            team: Name of the team
+
+        Returns:
+            The team's current score
+
+        Raises:
+            KeyError: If the team is not in the game
+        """
+        return self.scores[team]
+
+    def set_score(self, team: str, points: int) -> None:
+        """
+        Set one team's score in place.
+
+        Does not record an event or save; use update_scores() for turns.
+
+        Args:
+            team: Name of the team
+            points: New score for the team
+
+        Raises:
+            KeyError: If the team is not in the game
+        """
+        if team not in self.scores:
+            raise KeyError(team)
+        self.scores[team] = points
+
     def get_current_round(self) -> int:
         """Get the current round number."""
         return self.current_round
@@ -131,6 +304,21 @@ class GameState:
 
         return [event for event in self.events if event.round_number == round_number]
 
+    def group_events_by_round(self) -> Dict[int, List[GameEvent]]:
+        """
+        Group all events by the round they happened in.
+
+        Goes through the event history once, which is cheaper than calling
+        get_round_events() for every round.
+
+        Returns:
+            Dictionary of round number -> events in that round, in order
+        """
+        events_by_round = defaultdict(list)
+        for event in self.events:
+            events_by_round[event.round_number].append(event)
+        return dict(events_by_round)
+
     def update_scores(self, score_changes: Dict[str, int], team: str,
                       action: str, description: str) -> None:
         """
@@ -145,9 +333,8 @@ class GameState:
         # Apply score changes
         for team_name, change in score_changes.items():
             if team_name in self.scores:
-                self.scores[team_name] += change
                 # Ensure scores don't go below 0
-                self.scores[team_name] = max(0, self.scores[team_name])
+                self.set_score(team_name, max(0, self.scores[team_name] + change))
 
         # Record the event
         event = GameEvent(
@@ -159,6 +346,7 @@ class GameState:
             score_changes=score_changes
         )
         self.events.append(event)
+        self._changed()
 
         # Update timestamp and save
         self.last_updated = datetime.now().isoformat()
@@ -183,6 +371,7 @@ class GameState:
             score_changes=score_changes or {}
         )
         self.events.append(event)
+        self._changed()
         self.last_updated = datetime.now().isoformat()
         self.save_state()
 
@@ -270,11 +459,16 @@ class GameState:
 
         return "\n".join(lines)
 
-    def save_state(self) -> None:
-        """Save current game state to file."""
-        state_data = {
-            "teams": self.teams,
-            "scores": self.scores,
+    def to_dict(self) -> Dict:
+        """
+        Convert the game state to plain data that can be saved as JSON.
+
+        Returns:
+            Dictionary with teams, scores, round/turn tracking and events
+        """
+        return {
+            "teams": list(self.teams),
+            "scores": dict(self.scores),
             "current_round": self.current_round,
             "current_turn_index": self.current_turn_index,
             "game_started": self.game_started,
@@ -282,9 +476,46 @@ class GameState:
             "events": [asdict(event) for event in self.events]
         }
 
+    @classmethod
+    def from_dict(cls, state_data: Dict,
+                  state_file: str = "game_state.json") -> 'GameState':
+        """
+        Rebuild a game state from data produced by to_dict().
+
+        Args:
+            state_data: Dictionary as returned by to_dict()
+            state_file: Path the rebuilt game should save to
+
+        Returns:
+            GameState instance
+
+        Raises:
+            KeyError: If a required key is missing from state_data
+        """
+        game_state = cls.__new__(cls)
+        game_state.state_file = state_file
+        game_state.teams = state_data["teams"]
+        game_state.scores = state_data["scores"]
+        game_state.current_round = state_data["current_round"]
+        game_state.current_turn_index = state_data["current_turn_index"]
+        game_state.game_started = state_data["game_started"]
+        game_state.last_updated = state_data["last_updated"]
+
+        # Reconstruct events
+        game_state.events = [
+            GameEvent(**event_data)
+            for event_data in state_data["events"]
+        ]
+
+        return game_state
+
+    def save_state(self) -> None:
+        """Save current game state to file (skipped for in-memory games)."""
+        if self.state_file == MEMORY_STATE_FILE:
+            return
+
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(state_data, f, indent=2)
+            _write_json(self.to_dict(), self.state_file)
         except IOError as e:
             print(f"Error saving game state: {e}")
 
@@ -303,26 +534,9 @@ class GameState:
             return None
 
         try:
-            with open(state_file, 'r') as f:
-                state_data = json.load(f)
-
-            # Create new instance
-            game_state = cls.__new__(cls)
-            game_state.state_file = state_file
-            game_state.teams = state_data["teams"]
-            game_state.scores = state_data["scores"]
-            game_state.current_round = state_data["current_round"]
-            game_state.current_turn_index = state_data["current_turn_index"]
-            game_state.game_started = state_data["game_started"]
-            game_state.last_updated = state_data["last_updated"]
-
-            # Reconstruct events
-            game_state.events = [
-                GameEvent(**event_data)
-                for event_data in state_data["events"]
-            ]
-
-            return game_state
+            state_data = _read_json(state_file)
+
+            return cls.from_dict(state_data, state_file)
 
         except (json.JSONDecodeError, KeyError, IOError) as e:
             print(f"Error loading game state: {e}")
@@ -330,9 +544,13 @@ class GameState:
 
     def delete_save_file(self) -> None:
         """Delete the saved game state file."""
+        if self.state_file == MEMORY_STATE_FILE:
+            return
+
         try:
-            if os.path.exists(self.state_file):
-                os.unlink(self.state_file)
+            os.unlink(self.state_file)
+        except FileNotFoundError:
+            pass  # Nothing to delete
         except IOError as e:
             print(f"Error deleting save file: {e}")
 
@@ -351,8 +569,7 @@ def has_saved_game(state_file: str = "game_state.json") -> bool:
         return False
 
     try:
-        with open(state_file, 'r') as f:
-            state_data = json.load(f)
+        state_data = _read_json(state_file)
         # Check for required keys
         required_keys = ["teams", "scores", "current_round"]
         return all(key in state_data for key in required_keys)
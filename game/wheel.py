@@ -5,12 +5,119 @@ This module handles the wheel spinning logic, outcome processing, and
 integration with game state and configuration.
 """
 
+import bisect
 import random
-from typing import Dict, List, Tuple, Optional
+import sys
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Dict, List, Sequence, Tuple, Optional
 from .config import GameConfig
 from .state import GameState
 
 
+# Score cap used when max_points is 0 (no limit)
+_NO_CAP = sys.maxsize
+
+# Outcome operations, used to index GameWheel's dispatch table
+ADD_FIXED = 0
+STEAL = 1
+SHARE_ALL = 2
+MULTIPLY = 3
+DIVIDE = 4
+SWAP_RANDOM = 5
+WILDCARD = 6
+NO_OP = 7      # Unknown action with a parameter: nothing happens
+MYSTERY = 8    # Unknown action without a parameter: mystery bonus
+BAD_VALUE = 9  # Known action whose value is not an integer: error when processed
+
+# Actions written as "name:value" (e.g. "add_fixed:5"); read-only
+_PARAMETERIZED_OPS = MappingProxyType({
+    "add_fixed": ADD_FIXED,
+    "steal": STEAL,
+    "share_all": SHARE_ALL,
+    "multiply": MULTIPLY,
+    "divide": DIVIDE,
+})
+
+# Actions written as a bare name (e.g. "swap_random"); read-only
+_SIMPLE_OPS = MappingProxyType({
+    "swap_random": SWAP_RANDOM,
+    "wildcard": WILDCARD,
+})
+
+
+def _parse_action(action: str) -> Tuple[int, int]:
+    """
+    Turn an action string into an operation and its integer argument.
+
+    Never raises, so one malformed option in a config cannot stop a wheel
+    from being built. An action with a value that is not an integer (e.g.
+    "add_fixed:abc") gets BAD_VALUE, which raises only when it is processed.
+
+    Args:
+        action: Action identifier such as "add_fixed:5" or "swap_random"
+
+    Returns:
+        Tuple of (operation, argument); argument is 0 when there is none
+    """
+    name, sep, value = action.partition(":")
+    if not sep:
+        return _SIMPLE_OPS.get(name, MYSTERY), 0
+    
+    op = _PARAMETERIZED_OPS.get(name, NO_OP)
+    if op == NO_OP:
+        return NO_OP, 0
+    try:
+        return op, int(value)
+    except ValueError:
+        return BAD_VALUE, 0
+
+
+def _build_alias_table(
+    weights: Sequence[float],
+) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    Build a Vose alias table for picking index i with weights[i] / sum(weights).
+
+    To pick: choose a slot i uniformly, keep it if random() < probs[i],
+    otherwise take aliases[i]. Building is O(n); every pick is O(1).
+
+    Args:
+        weights: Positive weight for each option
+
+    Returns:
+        Tuple of (probs, aliases), one entry per option
+
+    Raises:
+        ValueError: If the weights do not add up to more than zero
+    """
+    n = len(weights)
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("Total of weights must be greater than zero")
+    scaled = [weight * n / total for weight in weights]
+    probs = [1.0] * n
+    aliases = list(range(n))
+    
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    
+    # Pair each under-full slot with an over-full one that tops it up
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        probs[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] = (scaled[more] + scaled[less]) - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+    
+    # Anything left over is full (within floating point error) and keeps probs of 1.0
+    return tuple(probs), tuple(aliases)
+
+
 class WheelOutcome:
     """
     Represents the result of a wheel spin.
@@ -23,12 +130,38 @@ class WheelOutcome:
         description: Detailed description of what happened
     """
     
+    # No per-instance __dict__: smaller outcomes and faster attribute access
+    __slots__ = (
+        "label", "action", "weight", "score_changes", "description", "_op", "_arg"
+    )
+    
     def __init__(self, label: str, action: str, weight: int):
         self.label = label
         self.action = action
         self.weight = weight
         self.score_changes: Dict[str, int] = {}
         self.description = ""
+        # Parsed once here so processing never has to split the string
+        self._op, self._arg = _parse_action(action)
+    
+    def copy(self) -> 'WheelOutcome':
+        """
+        Get a new, unprocessed outcome for the same wheel option.
+        
+        Reuses the already parsed action instead of parsing it again.
+        
+        Returns:
+            WheelOutcome with the same label, action and weight
+        """
+        outcome = WheelOutcome.__new__(WheelOutcome)
+        outcome.label = self.label
+        outcome.action = self.action
+        outcome.weight = self.weight
+        outcome.score_changes = {}
+        outcome.description = ""
+        outcome._op = self._op
+        outcome._arg = self._arg
+        return outcome
 
 
 class GameWheel:
@@ -49,24 +182,107 @@ class GameWheel:
         """
         self.config = config
         self.game_state = game_state
+        # Every other team, for each team, and the teams list it was built
+        # from (see _other_teams)
+        self._others: Dict[str, Tuple[str, ...]] = {}
+        self._others_teams: Optional[List[str]] = None
+        self._rebuild()
+        # is_game_over() result and the (config, game) versions it was worked out for
+        self._game_over_cache: Optional[bool] = None
+        self._game_over_key = None
+        # Last get_game_status() text and the state it was built for
+        self._status_cache: Optional[str] = None
+        self._status_key = None
+    
+    def _rebuild(self) -> None:
+        """Cache the config's score cap and drop the old sampling tables."""
+        self._cfg_version = self.config.version
+        max_points = self.config.get_max_points()
+        self._cap = max_points if max_points > 0 else _NO_CAP
+        # Built on the next spin, so a wheel that never spins never reads
+        # (or trips over) the wheel options
+        self._outcomes = None
+    
+    def _build_outcomes(self) -> None:
+        """Cache the config's wheel options and build their alias table."""
+        wheel_options = self.config.get_wheel_options()
+        # One parsed outcome per option; each spin hands out a copy
+        self._outcomes = tuple(
+            WheelOutcome(opt["label"], opt["action"], opt["weight"])
+            for opt in wheel_options
+        )
+        self._weights = tuple(opt["weight"] for opt in wheel_options)
+        self._alias_probs, self._alias_idx = _build_alias_table(self._weights)
+        # Only spin_many() uses these; it builds whichever one it needs
+        self._probs_np = None
+        self._cum = None
     
     def spin_wheel(self) -> WheelOutcome:
         """
         Spin the wheel and return a random outcome.
         
+        The cached options are rebuilt only when the config has changed
+        since the last spin.
+        
         Returns:
             WheelOutcome representing the selected option
+            
+        Raises:
+            ValueError: If the wheel option weights do not add up to more than zero
         """
-        wheel_options = self.config.get_wheel_options()
+        if self._cfg_version != self.config.version:
+            self._rebuild()
+        if self._outcomes is None:
+            self._build_outcomes()
+        
+        # Weighted pick in O(1): a uniform slot, then the slot or its alias
+        i = random.randrange(len(self._outcomes))
+        if random.random() >= self._alias_probs[i]:
+            i = self._alias_idx[i]
         
-        # Extract labels, actions, and weights
-        options = [(opt["label"], opt["action"], opt["weight"]) for opt in wheel_options]
-        weights = [opt[2] for opt in options]
+        return self._outcomes[i].copy()
+    
+    def spin_many(self, n: int, rng=None) -> List[int]:
+        """
+        Spin the wheel n times without processing anything.
         
-        # Randomly select based on weights
-        selected = random.choices(options, weights=weights, k=1)[0]
+        Meant for checking how a wheel behaves over many spins (e.g. how
+        often each outcome comes up); scores are not changed.
         
-        return WheelOutcome(selected[0], selected[1], selected[2])
+        Args:
+            n: Number of spins
+            rng: Source of randomness for repeatable results: a random.Random,
+                or a numpy Generator for faster large batches. If None, the
+                random module is used, so random.seed() applies as it does
+                for spin_wheel().
+            
+        Returns:
+            Index into the config's wheel options for each spin
+        """
+        if self._cfg_version != self.config.version:
+            self._rebuild()
+        if self._outcomes is None:
+            self._build_outcomes()
+        
+        if rng is not None and not isinstance(rng, random.Random):
+            # A numpy Generator, so numpy is already loaded. Imported here
+            # rather than at the top: it is slow to load and nothing else in
+            # the game needs it
+            import numpy as np
+            if self._probs_np is None:
+                weights = np.asarray(self._weights, dtype=np.float64)
+                self._probs_np = weights / weights.sum()
+            indices = rng.choice(len(self._probs_np), size=n, p=self._probs_np)
+            return indices.tolist()
+        
+        if self._cum is None:
+            self._cum = list(accumulate(self._weights))
+        
+        roll = (rng or random).random
+        cum = self._cum
+        total = cum[-1]
+        hi = len(cum) - 1
+        return [bisect.bisect_right(cum, roll() * total, 0, hi) for _ in range(n)]
     
     def process_outcome(self, outcome: WheelOutcome, spinning_team: str) -> None:
         """
@@ -76,12 +292,10 @@ class GameWheel:
             outcome: The wheel outcome to process
             spinning_team: Team that spun the wheel
         """
-        # Process different types of actions
-        if ":" in outcome.action:
-            action_type, value = outcome.action.split(":", 1)
-            self._process_parameterized_action(outcome, spinning_team, action_type, value)
-        else:
-            self._process_simple_action(outcome, spinning_team, outcome.action)
+        if self._cfg_version != self.config.version:
+            self._rebuild()
+        
+        self._HANDLERS[outcome._op](self, outcome, spinning_team, outcome._arg)
         
         # Update game state with the outcome
         self.game_state.update_scores(
@@ -91,75 +305,110 @@ class GameWheel:
             outcome.description
         )
     
-    def _process_parameterized_action(self, outcome: WheelOutcome, team: str, 
-                                    action_type: str, value: str) -> None:
-        """Process actions that have parameters (e.g., add_fixed:5)."""
-        if action_type == "add_fixed":
-            points = int(value)
-            # Apply rubber-banding: if team has 0 points and would lose points, give +5 instead
-            if self.game_state.get_scores()[team] <= 0 and points < 0:
-                points = 5
-                outcome.description = f"{team} would lose points but gets +5 instead (rubber-band effect)!"
-            else:
-                outcome.description = f"{team} {'gains' if points >= 0 else 'loses'} {abs(points)} points!"
-            
-            outcome.score_changes[team] = points
-            
-        elif action_type == "steal":
-            self._process_steal(outcome, team, int(value))
-            
-        elif action_type == "share_all":
-            points = int(value)
-            for team_name in self.game_state.teams:
-                outcome.score_changes[team_name] = points
-            outcome.description = f"Everyone gains {points} points!"
-            
-        elif action_type == "multiply":
-            multiplier = int(value)
-            current_score = self.game_state.get_scores()[team]
-            max_points = self.config.get_max_points()
-            
-            new_score = current_score * multiplier
-            if max_points > 0:
-                new_score = min(new_score, max_points)
-            
-            score_change = new_score - current_score
-            outcome.score_changes[team] = score_change
-            
-            if max_points > 0 and new_score == max_points:
-                outcome.description = f"{team} multiplies score by {multiplier} (capped at {max_points})!"
-            else:
-                outcome.description = f"{team} multiplies their score by {multiplier}!"
-                
-        elif action_type == "divide":
-            divisor = int(value)
-            current_score = self.game_state.get_scores()[team]
-            new_score = max((current_score + divisor - 1) // divisor, 0)  # Round up division, min 0
-            score_change = new_score - current_score
-            outcome.score_changes[team] = score_change
-            outcome.description = f"{team} divides their score by {divisor}!"
-    
-    def _process_simple_action(self, outcome: WheelOutcome, team: str, action: str) -> None:
-        """Process simple actions without parameters."""
-        if action == "swap_random":
-            self._process_swap(outcome, team)
-        elif action == "wildcard":
-            # Wildcard - teacher's choice, default to +5 points
-            outcome.score_changes[team] = 5
-            outcome.description = f"Wildcard! {team} completes a mini-challenge and gains 5 points!"
+    def _process_add_fixed(self, outcome: WheelOutcome, team: str,
+                           points: int) -> None:
+        """Process fixed point changes (e.g., add_fixed:5)."""
+        # Apply rubber-banding: if team has 0 points and would lose points,
+        # give +5 instead
+        if self.game_state.score_of(team) <= 0 and points < 0:
+            points = 5
+            outcome.description = (
+                f"{team} would lose points but gets +5 instead (rubber-band effect)!"
+            )
+        else:
+            verb = 'gains' if points >= 0 else 'loses'
+            outcome.description = f"{team} {verb} {abs(points)} points!"
+        
+        outcome.score_changes[team] = points
+    
+    def _process_share_all(self, outcome: WheelOutcome, team: str,
+                           points: int) -> None:
+        """Process points given to every team."""
+        outcome.score_changes = dict.fromkeys(self.game_state.teams, points)
+        outcome.description = f"Everyone gains {points} points!"
+    
+    def _process_multiply(self, outcome: WheelOutcome, team: str,
+                          multiplier: int) -> None:
+        """Process score multiplication, capped at max_points if set."""
+        current_score = self.game_state.score_of(team)
+        # _cap is max_points, or sys.maxsize when there is no limit
+        new_score = min(current_score * multiplier, self._cap)
+        
+        score_change = new_score - current_score
+        outcome.score_changes[team] = score_change
+        
+        if new_score == self._cap:
+            outcome.description = (
+                f"{team} multiplies score by {multiplier} (capped at {self._cap})!"
+            )
         else:
-            # Unknown action, give default points
-            outcome.score_changes[team] = 5
-            outcome.description = f"{team} gets a mystery bonus: +5 points!"
+            outcome.description = f"{team} multiplies their score by {multiplier}!"
+    
+    def _process_divide(self, outcome: WheelOutcome, team: str, divisor: int) -> None:
+        """Process score division."""
+        current_score = self.game_state.score_of(team)
+        # Round up division, min 0
+        new_score = max((current_score + divisor - 1) // divisor, 0)
+        score_change = new_score - current_score
+        outcome.score_changes[team] = score_change
+        outcome.description = f"{team} divides their score by {divisor}!"
+    
+    def _process_wildcard(self, outcome: WheelOutcome, team: str, value: int) -> None:
+        """Process wildcard - teacher's choice, default to +5 points."""
+        outcome.score_changes[team] = 5
+        outcome.description = (
+            f"Wildcard! {team} completes a mini-challenge and gains 5 points!"
+        )
+    
+    def _process_no_op(self, outcome: WheelOutcome, team: str, value: int) -> None:
+        """Unknown action with a parameter: nothing happens."""
+    
+    def _process_mystery(self, outcome: WheelOutcome, team: str, value: int) -> None:
+        """Unknown action without a parameter: give default points."""
+        outcome.score_changes[team] = 5
+        outcome.description = f"{team} gets a mystery bonus: +5 points!"
+    
+    def _process_bad_value(self, outcome: WheelOutcome, team: str, value: int) -> None:
+        """Known action with a value that is not an integer: report the option."""
+        raise ValueError(
+            f"Wheel option {outcome.label!r} has an invalid action {outcome.action!r}: "
+            "the value must be an integer"
+        )
+    
+    def _other_teams(self, team: str) -> Tuple[str, ...]:
+        """
+        Get every team except the given one (steal and swap pick from these).
+        
+        The per-team tuples are rebuilt whenever game_state.teams is a
+        different list, e.g. after the wheel is pointed at another game.
+        
+        Args:
+            team: Team to leave out
+            
+        Returns:
+            Tuple of the other teams' names
+        """
+        teams = self.game_state.teams
+        if teams is not self._others_teams:
+            self._others = {
+                name: tuple(other for other in teams if other != name)
+                for name in teams
+            }
+            self._others_teams = teams
+        
+        others = self._others.get(team)
+        if others is None:
+            # Not one of the game's teams: every team is an "other" team
+            return tuple(other for other in teams if other != team)
+        return others
     
     def _process_steal(self, outcome: WheelOutcome, stealing_team: str, amount: int) -> None:
         """Process steal actions."""
-        scores = self.game_state.get_scores()
+        score_of = self.game_state.score_of
         
         # Find teams that have points to steal
         eligible_victims = [
-            team for team in self.game_state.teams 
-            if team != stealing_team and scores[team] > 0
+            team for team in self._other_teams(stealing_team) if score_of(team) > 0
         ]
         
         if not eligible_victims:
@@ -169,16 +418,17 @@ class GameWheel:
             return
         
         # Randomly select a victim
-        victim = random.choice(eligible_victims)
-        actual_stolen = min(amount, scores[victim])
+        victim = eligible_victims[random.randrange(len(eligible_victims))]
+        actual_stolen = min(amount, score_of(victim))
         
         outcome.score_changes[stealing_team] = actual_stolen
         outcome.score_changes[victim] = -actual_stolen
         outcome.description = f"{stealing_team} steals {actual_stolen} points from {victim}!"
     
-    def _process_swap(self, outcome: WheelOutcome, swapping_team: str) -> None:
+    def _process_swap(self, outcome: WheelOutcome, swapping_team: str,
+                      value: int) -> None:
         """Process score swap actions."""
-        other_teams = [team for team in self.game_state.teams if team != swapping_team]
+        other_teams = self._other_teams(swapping_team)
         
         if not other_teams:
             # Only one team (shouldn't happen in normal play)
@@ -186,17 +436,30 @@ class GameWheel:
             return
         
         # Randomly select team to swap with
-        swap_target = random.choice(other_teams)
-        scores = self.game_state.get_scores()
-        
-        swapping_score = scores[swapping_team]
-        target_score = scores[swap_target]
+        swap_target = other_teams[random.randrange(len(other_teams))]
+        swapping_score = self.game_state.score_of(swapping_team)
+        target_score = self.game_state.score_of(swap_target)
         
         # Calculate the changes needed
         outcome.score_changes[swapping_team] = target_score - swapping_score
         outcome.score_changes[swap_target] = swapping_score - target_score
         outcome.description = f"{swapping_team} swaps scores with {swap_target}!"
     
+    # Outcome handlers, indexed by operation (ADD_FIXED, STEAL, ...).
+    # Built once for the class instead of a tuple of bound methods per wheel.
+    _HANDLERS = (
+        _process_add_fixed,
+        _process_steal,
+        _process_share_all,
+        _process_multiply,
+        _process_divide,
+        _process_swap,
+        _process_wildcard,
+        _process_no_op,
+        _process_mystery,
+        _process_bad_value,
+    )
+    
     def spin_and_process(self, team: Optional[str] = None) -> Tuple[WheelOutcome, str]:
         """
         Convenience method to spin wheel and process outcome for current team.
@@ -237,9 +500,19 @@ class GameWheel:
         """
         Check if the game should end based on configuration limits.
         
+        The answer is cached until the config or the game changes.
+        
         Returns:
             True if game should end
         """
+        key = (self.config.version, self.game_state.version)
+        if key != self._game_over_key:
+            self._game_over_cache = self._check_game_over()
+            self._game_over_key = key
+        return self._game_over_cache
+    
+    def _check_game_over(self) -> bool:
+        """Work out whether the game is over (see is_game_over)."""
         max_rounds = self.config.get_max_rounds()
         max_points = self.config.get_max_points()
         
@@ -249,8 +522,8 @@ class GameWheel:
         
         # Check point limit (if set)
         if max_points > 0:
-            scores = self.game_state.get_scores()
-            if any(score >= max_points for score in scores.values()):
+            # Read the scores in place; get_scores() would copy them
+            if any(score >= max_points for score in self.game_state.scores.values()):
                 return True
         
         return False
@@ -259,9 +532,19 @@ class GameWheel:
         """
         Get current game status summary.
         
+        The text is reused until the config or the game changes.
+        
         Returns:
             Formatted string with game status
         """
+        key = (self.config.version, self.game_state.version)
+        if key != self._status_key:
+            self._status_cache = self._format_game_status()
+            self._status_key = key
+        return self._status_cache
+    
+    def _format_game_status(self) -> str:
+        """Build the game status text (see get_game_status)."""
         lines = []
         lines.append(self.game_state.get_game_summary())
         
@@ -270,7 +553,7 @@ class GameWheel:
             lines.append("🎉 GAME OVER! 🎉")
             
             # Find winner(s)
-            scores = self.game_state.get_scores()
+            scores = self.game_state.scores
             max_score = max(scores.values())
             winners = [team for team, score in scores.items() if score == max_score]
             
@@ -306,4 +589,4 @@ def pick_random_starting_team(teams: List[str]) -> str:
     Returns:
         Name of the randomly selected team
     """
-    return random.choice(teams)
\ No newline at end of file
+    return teams[random.randrange(len(teams))]
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Shared pytest fixtures for the Unfair Review Game tests.
+
+Building a default GameConfig writes the default configuration to disk,
+so the default file is created once per test session. Its bytes are
+cached and written into each test's temporary directory when a test
+needs its own config.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from game.config import GameConfig
+
+# RAM-backed filesystem available on most Linux machines
+SHARED_MEMORY_DIR = "/dev/shm"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Keep temporary test files in memory when the machine allows it.
+
+    The tests write lots of tiny JSON files. Pointing Python's temp
+    directory at /dev/shm makes tmp_path (and tempfile) use RAM instead
+    of the disk. An explicit --basetemp always wins.
+    """
+    if config.option.basetemp or os.environ.get("PYTEST_DEBUG_TEMPROOT"):
+        return
+    if os.path.isdir(SHARED_MEMORY_DIR) and os.access(SHARED_MEMORY_DIR, os.W_OK):
+        tempfile.tempdir = SHARED_MEMORY_DIR
+
+
+@pytest.fixture(scope="session")
+def default_config_template(tmp_path_factory):
+    """Path to a default config file, created once per test session.
+
+    Tests must treat this file as read-only.
+    """
+    path = tmp_path_factory.mktemp("cfg") / "default.json"
+    GameConfig(str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def default_config(default_config_template):
+    """A default GameConfig shared by the whole session.
+
+    Only for tests that read settings; use fresh_config to change them.
+    """
+    return GameConfig(str(default_config_template))
+
+
+@pytest.fixture(scope="session")
+def default_config_bytes(default_config_template):
+    """Raw contents of the default config file."""
+    return default_config_template.read_bytes()
+
+
+@pytest.fixture
+def fresh_config_path(tmp_path, default_config_bytes):
+    """Path to a per-test copy of the default config file."""
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(default_config_bytes)
+    return str(config_path)
+
+
+@pytest.fixture
+def fresh_config(fresh_config_path):
+    """A GameConfig with default settings that a test is free to modify."""
+    return GameConfig(fresh_config_path)
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    """Path for a per-test game state file (not created yet)."""
+    return str(tmp_path / "state.json")
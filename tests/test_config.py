@@ -7,6 +7,7 @@ Tests configuration loading, saving, updating, and validation.
 import json
 import os
 import tempfile
+from pathlib import Path
 import pytest
 from game.config import GameConfig, load_config
 
@@ -14,23 +15,15 @@ from game.config import GameConfig, load_config
 class TestGameConfig:
     """Test cases for GameConfig class."""
     
-    def setup_method(self):
-        """Set up test with temporary config file."""
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.config_path = self.temp_file.name
-        # Remove the empty file so GameConfig creates a new one
-        os.unlink(self.config_path)
-        self.config = GameConfig(self.config_path)
+    @pytest.fixture(autouse=True)
+    def setup_config(self, fresh_config):
+        """Give each test its own modifiable copy of the default config."""
+        self.config = fresh_config
+        self.config_path = fresh_config.config_file
     
-    def teardown_method(self):
-        """Clean up temporary files."""
-        if os.path.exists(self.config_path):
-            os.unlink(self.config_path)
-    
-    def test_default_config_creation(self):
+    def test_default_config_creation(self, default_config_template):
         """Test that default configuration is created correctly."""
-        config = self.config.get_config()
+        config = GameConfig(str(default_config_template)).get_config()
         
         # Check all required keys exist
         assert "wheel_options" in config
@@ -48,11 +41,11 @@ class TestGameConfig:
         assert config["max_rounds"] == 20
         assert config["starting_round"] == 1
     
-    def test_config_file_creation(self):
+    def test_config_file_creation(self, default_config_template):
         """Test that config file is created with defaults."""
-        assert os.path.exists(self.config_path)
+        assert os.path.exists(default_config_template)
         
-        with open(self.config_path, 'r') as f:
+        with open(default_config_template, 'r') as f:
             saved_config = json.load(f)
         
         assert "teams" in saved_config
@@ -66,8 +59,7 @@ class TestGameConfig:
             "max_points": 100
         }
         
-        with open(self.config_path, 'w') as f:
-            json.dump(test_config, f)
+        Path(self.config_path).write_text(json.dumps(test_config))
         
         config = GameConfig(self.config_path)
         assert config.get_teams() == ["Alpha", "Beta", "Gamma"]
@@ -80,14 +72,6 @@ class TestGameConfig:
         self.config.update_teams(new_teams)
         assert self.config.get_teams() == new_teams
     
-    def test_update_teams_invalid(self):
-        """Test updating teams with invalid input."""
-        with pytest.raises(ValueError):
-            self.config.update_teams([])  # Empty list
-        
-        with pytest.raises(ValueError):
-            self.config.update_teams(["OnlyOne"])  # Only one team
-    
     def test_update_starting_points_valid(self):
         """Test updating starting points with valid values."""
         self.config.update_starting_points(25)
@@ -96,11 +80,6 @@ class TestGameConfig:
         self.config.update_starting_points(0)
         assert self.config.get_starting_points() == 0
     
-    def test_update_starting_points_invalid(self):
-        """Test updating starting points with invalid values."""
-        with pytest.raises(ValueError):
-            self.config.update_starting_points(-5)
-    
     def test_update_max_points_valid(self):
         """Test updating max points with valid values."""
         self.config.update_max_points(50)
@@ -109,37 +88,16 @@ class TestGameConfig:
         self.config.update_max_points(0)  # No limit
         assert self.config.get_max_points() == 0
     
-    def test_update_max_points_invalid(self):
-        """Test updating max points with invalid values."""
-        with pytest.raises(ValueError):
-            self.config.update_max_points(-10)
-    
     def test_update_max_rounds_valid(self):
         """Test updating max rounds with valid values."""
         self.config.update_max_rounds(30)
         assert self.config.get_max_rounds() == 30
     
-    def test_update_max_rounds_invalid(self):
-        """Test updating max rounds with invalid values."""
-        with pytest.raises(ValueError):
-            self.config.update_max_rounds(0)
-        
-        with pytest.raises(ValueError):
-            self.config.update_max_rounds(-5)
-    
     def test_update_starting_round_valid(self):
         """Test updating starting round with valid values."""
         self.config.update_starting_round(3)
         assert self.config.get_starting_round() == 3
     
-    def test_update_starting_round_invalid(self):
-        """Test updating starting round with invalid values."""
-        with pytest.raises(ValueError):
-            self.config.update_starting_round(0)
-        
-        with pytest.raises(ValueError):
-            self.config.update_starting_round(-1)
-    
     def test_update_wheel_options_valid(self):
         """Test updating wheel options with valid data."""
         new_options = [
@@ -149,23 +107,18 @@ class TestGameConfig:
         self.config.update_wheel_options(new_options)
         assert self.config.get_wheel_options() == new_options
     
-    def test_update_wheel_options_invalid(self):
-        """Test updating wheel options with invalid data."""
-        with pytest.raises(ValueError):
-            self.config.update_wheel_options([])  # Empty list
+    def test_version_bumped_on_update(self):
+        """Test that every change to the config bumps its version."""
+        version = self.config.version
         
-        with pytest.raises(ValueError):
-            # Missing required keys
-            self.config.update_wheel_options([{"label": "Test"}])
+        self.config.update_max_points(50)
+        self.config.update_max_rounds(30)
         
-        with pytest.raises(ValueError):
-            # Invalid weight
-            invalid_options = [{"label": "Test", "action": "test", "weight": 0}]
-            self.config.update_wheel_options(invalid_options)
+        assert self.config.version == version + 2
     
-    def test_display_config(self):
+    def test_display_config(self, default_config):
         """Test configuration display format."""
-        display = self.config.display_config()
+        display = default_config.display_config()
         
         assert "Current Game Configuration" in display
         assert "Teams:" in display
@@ -191,6 +144,40 @@ class TestGameConfig:
         assert new_config.get_starting_points() == 42
 
 
+@pytest.fixture(scope="class")
+def shared_config(tmp_path_factory, default_config_bytes):
+    """One config shared by a test class; rejected updates never modify it."""
+    config_path = tmp_path_factory.mktemp("validation") / "config.json"
+    config_path.write_bytes(default_config_bytes)
+    return GameConfig(str(config_path))
+
+
+class TestGameConfigValidation:
+    """Invalid updates are rejected and leave the configuration unchanged."""
+    
+    @pytest.mark.parametrize("method,value", [
+        ("update_teams", []),
+        ("update_teams", ["OnlyOne"]),
+        ("update_starting_points", -5),
+        ("update_max_points", -10),
+        ("update_max_rounds", 0),
+        ("update_max_rounds", -5),
+        ("update_starting_round", 0),
+        ("update_starting_round", -1),
+        ("update_wheel_options", []),
+        ("update_wheel_options", [{"label": "Test"}]),  # Missing keys
+        ("update_wheel_options", [{"label": "Test", "action": "test", "weight": 0}]),
+    ])
+    def test_update_invalid(self, shared_config, method, value):
+        """Test that each update method rejects invalid values."""
+        before = shared_config.get_config()
+        
+        with pytest.raises(ValueError):
+            getattr(shared_config, method)(value)
+        
+        assert shared_config.get_config() == before
+
+
 def test_load_config_function():
     """Test the load_config convenience function."""
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
@@ -201,5 +188,4 @@ def test_load_config_function():
         assert isinstance(config, GameConfig)
         assert config.get_teams() == ["Red", "Blue"]
     finally:
-        if os.path.exists(config_path):
-            os.unlink(config_path)
\ No newline at end of file
+        Path(config_path).unlink(missing_ok=True)
\ No newline at end of file
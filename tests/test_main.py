@@ -10,259 +10,191 @@ from unittest.mock import patch, MagicMock
 from main import create_parser, main
 
 
+# Config object handed to main() by the patched GameConfig; shared by all tests
+_DUMMY_CONFIG = MagicMock()
+
+
+# Command lines for test_command_parsing and the attributes each should set
+_ARGV_CASES = (
+    pytest.param(("start", "Red", "Blue", "Green"),
+                 {"command": "start", "teams": ["Red", "Blue", "Green"],
+                  "points": None, "random_start": False},
+                 id="start"),
+    pytest.param(("start", "Team1", "Team2", "--points", "15", "--random-start"),
+                 {"points": 15, "random_start": True},
+                 id="start_with_options"),
+    pytest.param(("spin",), {"command": "spin", "team": None}, id="spin"),
+    pytest.param(("spin", "Blue"), {"team": "Blue"}, id="spin_team"),
+    pytest.param(("load", "saved_game.json"),
+                 {"command": "load", "file": "saved_game.json"}, id="load"),
+    pytest.param(("interactive",), {"command": "interactive"}, id="interactive"),
+    # Default delay
+    pytest.param(("auto-spin",), {"command": "auto-spin", "delay": 2.0},
+                 id="auto_spin"),
+    pytest.param(("auto-spin", "--delay", "1.5"), {"delay": 1.5}, id="auto_spin_delay"),
+    pytest.param(("simple",), {"command": "simple", "verbose": False}, id="simple"),
+    pytest.param(("simple", "--verbose"), {"verbose": True}, id="simple_verbose"),
+    pytest.param(("config", "show"), {"command": "config", "config_action": "show"},
+                 id="config_show"),
+    pytest.param(("config", "edit"), {"config_action": "edit"}, id="config_edit"),
+    pytest.param(("status",), {"command": "status"}, id="status"),
+)
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """One parser shared by the parsing tests; parse_args does not change it."""
+    return create_parser()
+
+
 class TestCreateParser:
     """Test cases for create_parser function."""
     
-    def test_parser_creation(self):
+    def test_parser_creation(self, parser):
         """Test that parser is created with correct structure."""
-        parser = create_parser()
         assert isinstance(parser, argparse.ArgumentParser)
         assert parser.description
         assert "Unfair Review Game" in parser.description
     
-    def test_global_options(self):
+    def test_global_options(self, parser):
         """Test global command line options."""
-        parser = create_parser()
-        
         # Test --config option
-        args = parser.parse_args(["--config", "test.json", "status"])
+        args = parser.parse_args(("--config", "test.json", "status"))
         assert args.config == "test.json"
         
         # Test --state option
-        args = parser.parse_args(["--state", "game.json", "status"])
+        args = parser.parse_args(("--state", "game.json", "status"))
         assert args.state == "game.json"
         
         # Test short versions
-        args = parser.parse_args(["-c", "test.json", "-s", "game.json", "status"])
+        args = parser.parse_args(("-c", "test.json", "-s", "game.json", "status"))
         assert args.config == "test.json"
         assert args.state == "game.json"
     
-    def test_start_command_parsing(self):
-        """Test start command argument parsing."""
-        parser = create_parser()
-        
-        # Basic team names
-        args = parser.parse_args(["start", "Red", "Blue", "Green"])
-        assert args.command == "start"
-        assert args.teams == ["Red", "Blue", "Green"]
-        assert args.points is None
-        assert args.random_start is False
-        
-        # With options
-        args = parser.parse_args(["start", "Team1", "Team2", "--points", "15", "--random-start"])
-        assert args.points == 15
-        assert args.random_start is True
-    
-    def test_spin_command_parsing(self):
-        """Test spin command argument parsing."""
-        parser = create_parser()
-        
-        # No team specified
-        args = parser.parse_args(["spin"])
-        assert args.command == "spin"
-        assert args.team is None
-        
-        # Team specified
-        args = parser.parse_args(["spin", "Blue"])
-        assert args.team == "Blue"
-    
-    def test_load_command_parsing(self):
-        """Test load command argument parsing."""
-        parser = create_parser()
-        
-        args = parser.parse_args(["load", "saved_game.json"])
-        assert args.command == "load"
-        assert args.file == "saved_game.json"
-    
-    def test_interactive_command_parsing(self):
-        """Test interactive command parsing."""
-        parser = create_parser()
+    @pytest.mark.parametrize("argv,expected", _ARGV_CASES)
+    def test_command_parsing(self, parser, argv, expected):
+        """Test that each command and its options parse as expected."""
+        args = parser.parse_args(argv)
         
-        args = parser.parse_args(["interactive"])
-        assert args.command == "interactive"
-    
-    def test_auto_spin_command_parsing(self):
-        """Test auto-spin command parsing."""
-        parser = create_parser()
-        
-        # Default delay
-        args = parser.parse_args(["auto-spin"])
-        assert args.command == "auto-spin"
-        assert args.delay == 2.0
-        
-        # Custom delay
-        args = parser.parse_args(["auto-spin", "--delay", "1.5"])
-        assert args.delay == 1.5
-    
-    def test_simple_command_parsing(self):
-        """Test simple command parsing."""
-        parser = create_parser()
-        
-        # Basic simple mode
-        args = parser.parse_args(["simple"])
-        assert args.command == "simple"
-        assert args.verbose is False
-        
-        # Verbose mode
-        args = parser.parse_args(["simple", "--verbose"])
-        assert args.verbose is True
-    
-    def test_config_command_parsing(self):
-        """Test config command parsing."""
-        parser = create_parser()
-        
-        # Show config
-        args = parser.parse_args(["config", "show"])
-        assert args.command == "config"
-        assert args.config_action == "show"
-        
-        # Edit config
-        args = parser.parse_args(["config", "edit"])
-        assert args.config_action == "edit"
-    
-    def test_status_command_parsing(self):
-        """Test status command parsing."""
-        parser = create_parser()
-        
-        args = parser.parse_args(["status"])
-        assert args.command == "status"
+        for name, value in expected.items():
+            assert getattr(args, name) == value
 
 
 class TestMainFunction:
     """Test cases for main function."""
     
-    @patch('main.GameConfig')
+    @pytest.fixture(autouse=True)
+    def patched_config(self):
+        """Replace GameConfig in main so no config file is read or written."""
+        with patch('main.GameConfig', return_value=_DUMMY_CONFIG) as mock_config_class:
+            yield mock_config_class
+        _DUMMY_CONFIG.reset_mock()
+    
     @patch('main.handle_start_command')
-    def test_main_start_command(self, mock_handle_start, mock_config_class):
+    def test_main_start_command(self, mock_handle_start, patched_config, monkeypatch):
         """Test main function with start command."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
+        monkeypatch.setattr('sys.argv', ['main.py', 'start', 'Red', 'Blue'])
         
-        with patch('sys.argv', ['main.py', 'start', 'Red', 'Blue']):
-            main()
-            
-            mock_config_class.assert_called_once_with('config.json')
-            mock_handle_start.assert_called_once()
+        main()
+        
+        patched_config.assert_called_once_with('config.json')
+        mock_handle_start.assert_called_once()
     
-    @patch('main.GameConfig')
     @patch('main.handle_spin_command')
-    def test_main_spin_command(self, mock_handle_spin, mock_config_class):
+    def test_main_spin_command(self, mock_handle_spin, monkeypatch):
         """Test main function with spin command."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
+        monkeypatch.setattr('sys.argv', ['main.py', 'spin'])
         
-        with patch('sys.argv', ['main.py', 'spin']):
-            main()
-            
-            mock_handle_spin.assert_called_once()
+        main()
+        
+        mock_handle_spin.assert_called_once()
     
-    @patch('main.GameConfig')
     @patch('main.run_interactive_mode')
-    def test_main_interactive_command(self, mock_interactive, mock_config_class):
+    def test_main_interactive_command(self, mock_interactive, monkeypatch):
         """Test main function with interactive command."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
+        monkeypatch.setattr('sys.argv', ['main.py', 'interactive'])
         
-        with patch('sys.argv', ['main.py', 'interactive']):
-            main()
-            
-            mock_interactive.assert_called_once()
+        main()
+        
+        mock_interactive.assert_called_once()
     
-    @patch('main.GameConfig')
     @patch('main.run_auto_spin_mode')
-    def test_main_auto_spin_command(self, mock_auto_spin, mock_config_class):
+    def test_main_auto_spin_command(self, mock_auto_spin, monkeypatch):
         """Test main function with auto-spin command."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
+        monkeypatch.setattr('sys.argv', ['main.py', 'auto-spin', '--delay', '1.0'])
         
-        with patch('sys.argv', ['main.py', 'auto-spin', '--delay', '1.0']):
-            main()
-            
-            mock_auto_spin.assert_called_once()
+        main()
+        
+        mock_auto_spin.assert_called_once()
     
-    @patch('main.GameConfig')
     @patch('main.run_simple_mode')
-    def test_main_simple_command(self, mock_simple, mock_config_class):
+    def test_main_simple_command(self, mock_simple, monkeypatch):
         """Test main function with simple command."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
+        monkeypatch.setattr('sys.argv', ['main.py', 'simple', '--verbose'])
         
-        with patch('sys.argv', ['main.py', 'simple', '--verbose']):
-            main()
-            
-            mock_simple.assert_called_once()
+        main()
+        
+        mock_simple.assert_called_once()
     
-    @patch('main.GameConfig')
     @patch('main.handle_config_command')
-    def test_main_config_command(self, mock_handle_config, mock_config_class):
+    def test_main_config_command(self, mock_handle_config, monkeypatch):
         """Test main function with config command."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
+        monkeypatch.setattr('sys.argv', ['main.py', 'config', 'show'])
         
-        with patch('sys.argv', ['main.py', 'config', 'show']):
-            main()
-            
-            mock_handle_config.assert_called_once()
+        main()
+        
+        mock_handle_config.assert_called_once()
     
-    @patch('main.GameConfig')
     @patch('main.handle_status_command')
-    def test_main_status_command(self, mock_handle_status, mock_config_class):
+    def test_main_status_command(self, mock_handle_status, monkeypatch):
         """Test main function with status command."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
+        monkeypatch.setattr('sys.argv', ['main.py', 'status'])
         
-        with patch('sys.argv', ['main.py', 'status']):
-            main()
-            
-            mock_handle_status.assert_called_once()
+        main()
+        
+        mock_handle_status.assert_called_once()
     
-    @patch('main.GameConfig')
-    def test_main_no_command(self, mock_config_class):
+    def test_main_no_command(self, monkeypatch):
         """Test main function with no command (help mode)."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
+        monkeypatch.setattr('sys.argv', ['main.py'])
         
-        with patch('sys.argv', ['main.py']):
-            with patch('builtins.print') as mock_print:
-                main()
-                
-                calls = [str(call) for call in mock_print.call_args_list]
-                assert any("Unfair Review Game" in call for call in calls)
+        with patch('builtins.print') as mock_print:
+            main()
+            
+            assert any("Unfair Review Game" in str(call)
+                       for call in mock_print.call_args_list)
     
-    @patch('main.GameConfig')
-    def test_main_config_error(self, mock_config_class):
+    def test_main_config_error(self, patched_config, monkeypatch, capsys):
         """Test main function when config loading fails."""
-        mock_config_class.side_effect = Exception("Config error")
+        patched_config.side_effect = Exception("Config error")
+        
+        monkeypatch.setattr('sys.argv', ['main.py', 'status'])
+        
+        with pytest.raises(SystemExit):
+            main()
         
-        with patch('sys.argv', ['main.py', 'status']):
-            with pytest.raises(SystemExit):
-                with patch('builtins.print'):
-                    main()
+        assert "Error loading configuration: Config error" in capsys.readouterr().out
     
-    @patch('main.GameConfig')
     @patch('main.handle_start_command')
-    def test_main_keyboard_interrupt(self, mock_handle_start, mock_config_class):
+    def test_main_keyboard_interrupt(self, mock_handle_start, monkeypatch):
         """Test main function handling KeyboardInterrupt."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
         mock_handle_start.side_effect = KeyboardInterrupt()
         
-        with patch('sys.argv', ['main.py', 'start', 'Red', 'Blue']):
-            with patch('builtins.print') as mock_print:
-                main()
-                
-                calls = [str(call) for call in mock_print.call_args_list]
-                assert any("Goodbye" in call for call in calls)
+        monkeypatch.setattr('sys.argv', ['main.py', 'start', 'Red', 'Blue'])
+        
+        with patch('builtins.print') as mock_print:
+            main()
+            
+            assert any("Goodbye" in str(call) for call in mock_print.call_args_list)
     
-    @patch('main.GameConfig')
     @patch('main.handle_start_command')
-    def test_main_general_exception(self, mock_handle_start, mock_config_class):
+    def test_main_general_exception(self, mock_handle_start, monkeypatch, capsys):
         """Test main function handling general exceptions."""
-        mock_config = MagicMock()
-        mock_config_class.return_value = mock_config
         mock_handle_start.side_effect = Exception("Test error")
         
-        with patch('sys.argv', ['main.py', 'start', 'Red', 'Blue']):
-            with pytest.raises(SystemExit):
-                with patch('builtins.print'):
-                    main()
\ No newline at end of file
+        monkeypatch.setattr('sys.argv', ['main.py', 'start', 'Red', 'Blue'])
+        
+        with pytest.raises(SystemExit):
+            main()
+        
+        assert "Error: Test error" in capsys.readouterr().out
@@ -4,13 +4,14 @@ Tests for game/state.py module.
 Tests game state management, persistence, and recovery functionality.
 """
 
+import copy
 import json
 import os
-import tempfile
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 from game.state import (
-    GameState, GameEvent, has_saved_game, 
+    GameState, GameEvent, MEMORY_STATE_FILE, has_saved_game, 
     create_new_game, load_saved_game
 )
 
@@ -35,149 +36,212 @@ class TestGameEvent:
         assert event.action == "add_fixed:5"
         assert event.description == "Red team gains 5 points"
         assert event.score_changes == {"Red": 5}
+        assert not hasattr(event, "__dict__")  # Slotted dataclass
 
 
-class TestGameState:
-    """Test cases for GameState class."""
+TEAMS = ["Red", "Blue", "Green"]
+FROZEN_NOW = datetime(2023, 1, 1, 12, 0, 0)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
     
-    def setup_method(self):
-        """Set up test with temporary state file."""
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.state_path = self.temp_file.name
-        # Remove empty file
-        os.unlink(self.state_path)
-        
-        self.teams = ["Red", "Blue", "Green"]
-        self.game_state = GameState(
-            teams=self.teams,
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Stop the clock so game timestamps are fixed and predictable."""
+    monkeypatch.setattr("game.state.datetime", FrozenDatetime)
+
+
+@pytest.fixture(scope="module")
+def template_state():
+    """A three-team game built once, in memory only, for game_state to copy."""
+    with patch("game.state.datetime", FrozenDatetime):
+        return GameState(
+            teams=TEAMS,
             starting_points=15,
             starting_round=2,
-            state_file=self.state_path
+            state_file=MEMORY_STATE_FILE
         )
+
+
+@pytest.fixture
+def game_state(template_state):
+    """A three-team in-memory game starting at round 2 with 15 points each."""
+    return copy.deepcopy(template_state)
+
+
+@pytest.fixture
+def saved_game_state(game_state, state_path):
+    """The game_state game, saved to state_path like a new GameState would be."""
+    game_state.state_file = state_path
+    game_state.save_state()
+    return game_state
+
+
+@pytest.mark.usefixtures("frozen_clock")
+class TestGameState:
+    """Test cases for GameState class."""
     
-    def teardown_method(self):
-        """Clean up temporary files."""
-        if os.path.exists(self.state_path):
-            os.unlink(self.state_path)
-    
-    def test_initial_state(self):
+    def test_initial_state(self, game_state):
         """Test initial game state is correct."""
-        assert self.game_state.teams == self.teams
-        assert self.game_state.get_scores() == {"Red": 15, "Blue": 15, "Green": 15}
-        assert self.game_state.get_current_round() == 2
-        assert self.game_state.get_current_team() == "Red"
-        assert len(self.game_state.events) == 0
+        assert game_state.teams == TEAMS
+        assert game_state.get_scores() == {"Red": 15, "Blue": 15, "Green": 15}
+        assert game_state.get_current_round() == 2
+        assert game_state.get_current_team() == "Red"
+        assert len(game_state.events) == 0
     
-    def test_state_file_creation(self):
+    def test_state_file_creation(self, saved_game_state, state_path):
         """Test that state file is created automatically."""
-        assert os.path.exists(self.state_path)
+        assert os.path.exists(state_path)
         
-        with open(self.state_path, 'r') as f:
+        with open(state_path, 'r') as f:
             state_data = json.load(f)
         
-        assert state_data["teams"] == self.teams
+        assert state_data["teams"] == TEAMS
         assert state_data["scores"] == {"Red": 15, "Blue": 15, "Green": 15}
         assert state_data["current_round"] == 2
     
-    def test_update_scores(self):
+    def test_update_scores(self, game_state):
         """Test updating scores and recording events."""
         score_changes = {"Red": 10, "Blue": -5}
-        self.game_state.update_scores(
+        game_state.update_scores(
             score_changes=score_changes,
             team="Red",
             action="test_action",
             description="Test event"
         )
         
-        scores = self.game_state.get_scores()
+        scores = game_state.get_scores()
         assert scores["Red"] == 25  # 15 + 10
         assert scores["Blue"] == 10  # 15 - 5
         assert scores["Green"] == 15  # unchanged
         
         # Check event was recorded
-        assert len(self.game_state.events) == 1
-        event = self.game_state.events[0]
+        assert len(game_state.events) == 1
+        event = game_state.events[0]
         assert event.team == "Red"
         assert event.action == "test_action"
         assert event.description == "Test event"
         assert event.score_changes == score_changes
+        assert event.timestamp == FROZEN_NOW.isoformat()
+    
+    def test_score_of_and_set_score(self, game_state):
+        """Test reading and setting a single team's score."""
+        game_state.set_score("Blue", 42)
+        
+        assert game_state.score_of("Blue") == 42
+        assert game_state.get_scores() == {"Red": 15, "Blue": 42, "Green": 15}
+        assert game_state.events == []  # Not a turn, so nothing is recorded
+        
+        with pytest.raises(KeyError):
+            game_state.set_score("Purple", 1)
     
-    def test_scores_never_go_negative(self):
+    def test_scores_version_changes(self, game_state):
+        """Test that any change to the scores gives them a new version."""
+        versions = {game_state.scores.version}
+        
+        game_state.scores["Red"] = 3
+        versions.add(game_state.scores.version)
+        game_state.scores = {team: 0 for team in TEAMS}
+        versions.add(game_state.scores.version)
+        game_state.update_scores({"Blue": 1}, "Blue", "test", "Test event")
+        versions.add(game_state.scores.version)
+        
+        assert len(versions) == 4
+    
+    def test_game_version_changes(self, game_state):
+        """Test that every kind of change to the game gives it a new version."""
+        versions = {game_state.version}
+        
+        game_state.scores["Red"] = 3
+        versions.add(game_state.version)
+        game_state.current_round = 5
+        versions.add(game_state.version)
+        game_state.next_turn()
+        versions.add(game_state.version)
+        game_state.add_event("note", "Just a note")
+        versions.add(game_state.version)
+        
+        assert len(versions) == 5
+    
+    def test_scores_never_go_negative(self, game_state):
         """Test that scores are clamped to 0."""
         score_changes = {"Red": -20}  # More than starting points
-        self.game_state.update_scores(
+        game_state.update_scores(
             score_changes=score_changes,
             team="Red",
             action="big_loss",
             description="Red loses big"
         )
         
-        scores = self.game_state.get_scores()
+        scores = game_state.get_scores()
         assert scores["Red"] == 0  # Clamped to 0, not -5
     
-    def test_next_turn(self):
+    def test_next_turn(self, game_state):
         """Test advancing turns."""
-        assert self.game_state.get_current_team() == "Red"
+        assert game_state.get_current_team() == "Red"
         
-        next_team = self.game_state.next_turn()
+        next_team = game_state.next_turn()
         assert next_team == "Blue"
-        assert self.game_state.get_current_team() == "Blue"
+        assert game_state.get_current_team() == "Blue"
         
-        self.game_state.next_turn()
-        assert self.game_state.get_current_team() == "Green"
+        game_state.next_turn()
+        assert game_state.get_current_team() == "Green"
         
         # Should wrap around
-        self.game_state.next_turn()
-        assert self.game_state.get_current_team() == "Red"
+        game_state.next_turn()
+        assert game_state.get_current_team() == "Red"
     
-    def test_next_round(self):
+    def test_next_round(self, game_state):
         """Test advancing rounds."""
         # Advance to Blue's turn (each turn increments round)
-        self.game_state.next_turn()
-        assert self.game_state.get_current_team() == "Blue"
-        assert self.game_state.get_current_round() == 3  # Started at 2, now 3
+        game_state.next_turn()
+        assert game_state.get_current_team() == "Blue"
+        assert game_state.get_current_round() == 3  # Started at 2, now 3
         
         # next_round() should reset to Red and increment round again
-        new_round = self.game_state.next_round()
+        new_round = game_state.next_round()
         assert new_round == 4  # Was 3, now 4
-        assert self.game_state.get_current_round() == 4
-        assert self.game_state.get_current_team() == "Red"  # Reset to first team
+        assert game_state.get_current_round() == 4
+        assert game_state.get_current_team() == "Red"  # Reset to first team
     
-    def test_round_events(self):
+    def test_round_events(self, game_state):
         """Test getting events for specific rounds."""
         # Add events to round 2
-        self.game_state.update_scores({"Red": 5}, "Red", "test1", "Event 1")
-        self.game_state.update_scores({"Blue": 3}, "Blue", "test2", "Event 2")
+        game_state.update_scores({"Red": 5}, "Red", "test1", "Event 1")
+        game_state.update_scores({"Blue": 3}, "Blue", "test2", "Event 2")
         
         # Advance to round 3
-        self.game_state.next_round()
+        game_state.next_round()
         
         # Add event to round 3
-        self.game_state.update_scores({"Green": 2}, "Green", "test3", "Event 3")
-        
-        # Check round 2 events
-        round_2_events = self.game_state.get_round_events(2)
-        assert len(round_2_events) == 2
-        assert round_2_events[0].description == "Event 1"
-        assert round_2_events[1].description == "Event 2"
+        game_state.update_scores({"Green": 2}, "Green", "test3", "Event 3")
         
-        # Check round 3 events
-        round_3_events = self.game_state.get_round_events(3)
-        assert len(round_3_events) == 1
-        assert round_3_events[0].description == "Event 3"
+        # Check events for every round in one pass
+        events_by_round = game_state.group_events_by_round()
+        descriptions = {
+            round_number: [event.description for event in events]
+            for round_number, events in events_by_round.items()
+        }
+        assert descriptions == {2: ["Event 1", "Event 2"], 3: ["Event 3"]}
+        assert game_state.get_round_events(2) == events_by_round[2]
         
         # Check current round (should be 3)
-        current_events = self.game_state.get_round_events()
+        current_events = game_state.get_round_events()
         assert len(current_events) == 1
         assert current_events[0].description == "Event 3"
     
-    def test_game_summary(self):
+    def test_game_summary(self, game_state):
         """Test game summary formatting."""
         # Update some scores
-        self.game_state.update_scores({"Red": 10, "Blue": -5}, "Red", "test", "Test")
+        game_state.update_scores({"Red": 10, "Blue": -5}, "Red", "test", "Test")
         
-        summary = self.game_state.get_game_summary()
+        summary = game_state.get_game_summary()
         
         assert "Current Game State" in summary
         assert "Round: 2" in summary
@@ -185,119 +249,146 @@ class TestGameState:
         assert "Red: 25 points <-- Current turn" in summary
         assert "Total Events: 1" in summary
     
-    def test_round_history(self):
+    def test_round_history(self, game_state):
         """Test round history formatting."""
         # Add some events
-        self.game_state.update_scores({"Red": 5}, "Red", "test1", "Red gains 5")
-        self.game_state.update_scores({"Blue": 3}, "Blue", "test2", "Blue gains 3")
+        game_state.update_scores({"Red": 5}, "Red", "test1", "Red gains 5")
+        game_state.update_scores({"Blue": 3}, "Blue", "test2", "Blue gains 3")
         
-        history = self.game_state.get_round_history()
+        history = game_state.get_round_history()
         
         assert "Round 2 History" in history
+        assert "12:00:00" in history  # Event time from the frozen clock
         assert "Red gains 5" in history
         assert "Blue gains 3" in history
         
         # Test empty round
-        self.game_state.next_round()
-        empty_history = self.game_state.get_round_history()
+        game_state.next_round()
+        empty_history = game_state.get_round_history()
         assert "No events yet this round" in empty_history
     
-    def test_state_persistence(self):
+    def test_state_persistence(self, saved_game_state, state_path):
         """Test that state changes are saved and can be loaded."""
         # Make some changes
-        self.game_state.update_scores({"Red": 7}, "Red", "test", "Test event")
-        self.game_state.next_turn()  # Round 2->3, team Red->Blue
-        self.game_state.next_round()  # Round 3->4, team Blue->Red
+        saved_game_state.update_scores({"Red": 7}, "Red", "test", "Test event")
+        saved_game_state.next_turn()  # Round 2->3, team Red->Blue
+        saved_game_state.next_round()  # Round 3->4, team Blue->Red
         
         # Load state from file
-        loaded_state = GameState.load_state(self.state_path)
+        loaded_state = GameState.load_state(state_path)
         
         assert loaded_state is not None
-        assert loaded_state.teams == self.teams
+        assert loaded_state.teams == TEAMS
         assert loaded_state.get_scores()["Red"] == 22  # 15 + 7
         assert loaded_state.get_current_team() == "Red"  # Reset on new round
         assert loaded_state.get_current_round() == 4  # Started at 2, +1 for next_turn, +1 for next_round
         assert len(loaded_state.events) == 1
         assert loaded_state.events[0].description == "Test event"
     
-    def test_load_nonexistent_state(self):
+    def test_state_persistence_without_orjson(self, saved_game_state, state_path,
+                                              monkeypatch):
+        """Test that saving and loading work with the standard json module."""
+        monkeypatch.setattr("game.state.orjson", None)
+        saved_game_state.update_scores({"Green": 4}, "Green", "test", "Test event")
+        
+        loaded_state = GameState.load_state(state_path)
+        
+        assert loaded_state is not None
+        assert loaded_state.to_dict() == saved_game_state.to_dict()
+    
+    def test_dict_roundtrip(self, game_state, state_path):
+        """Test that from_dict rebuilds the same game that to_dict describes."""
+        game_state.update_scores({"Blue": 3}, "Blue", "test", "Test event")
+        game_state.next_turn()
+        
+        rebuilt = GameState.from_dict(game_state.to_dict(), state_path)
+        
+        assert rebuilt.teams == game_state.teams
+        assert rebuilt.get_scores() == game_state.get_scores()
+        assert rebuilt.get_current_round() == game_state.get_current_round()
+        assert rebuilt.get_current_team() == game_state.get_current_team()
+        assert rebuilt.events == game_state.events
+        assert rebuilt.state_file == state_path
+    
+    def test_memory_state_is_never_saved(self, tmp_path, monkeypatch):
+        """Test that a ":memory:" game does not write any file."""
+        monkeypatch.chdir(tmp_path)
+        state = GameState(["Red", "Blue"], state_file=MEMORY_STATE_FILE)
+        state.update_scores({"Red": 5}, "Red", "test", "Test event")
+        state.next_turn()
+        state.delete_save_file()
+        
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_load_nonexistent_state(self, state_path):
         """Test loading state from nonexistent file."""
-        loaded_state = GameState.load_state("nonexistent.json")
+        loaded_state = GameState.load_state(state_path)
         assert loaded_state is None
     
-    def test_load_invalid_state(self):
+    def test_load_invalid_state(self, state_path):
         """Test loading state from invalid file."""
         # Create invalid JSON file
-        with open(self.state_path, 'w') as f:
+        with open(state_path, 'w') as f:
             f.write("invalid json")
         
-        loaded_state = GameState.load_state(self.state_path)
+        loaded_state = GameState.load_state(state_path)
         assert loaded_state is None
     
-    def test_delete_save_file(self):
+    def test_delete_save_file(self, saved_game_state, state_path):
         """Test deleting save file."""
-        assert os.path.exists(self.state_path)
+        assert os.path.exists(state_path)
+        
+        saved_game_state.delete_save_file()
+        assert not os.path.exists(state_path)
         
-        self.game_state.delete_save_file()
-        assert not os.path.exists(self.state_path)
+        # Deleting again is harmless
+        saved_game_state.delete_save_file()
 
 
 class TestUtilityFunctions:
     """Test utility functions."""
     
-    def setup_method(self):
-        """Set up test with temporary file."""
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.state_path = self.temp_file.name
-        os.unlink(self.state_path)
-    
-    def teardown_method(self):
-        """Clean up."""
-        if os.path.exists(self.state_path):
-            os.unlink(self.state_path)
-    
-    def test_has_saved_game_false(self):
+    def test_has_saved_game_false(self, state_path):
         """Test has_saved_game with no file."""
-        assert not has_saved_game(self.state_path)
+        assert not has_saved_game(state_path)
     
-    def test_has_saved_game_true(self):
+    def test_has_saved_game_true(self, state_path):
         """Test has_saved_game with valid file."""
         # Create game state
-        game_state = create_new_game(["Red", "Blue"], state_file=self.state_path)
+        game_state = create_new_game(["Red", "Blue"], state_file=state_path)
         
-        assert has_saved_game(self.state_path)
+        assert has_saved_game(state_path)
     
-    def test_has_saved_game_invalid_file(self):
+    def test_has_saved_game_invalid_file(self, state_path):
         """Test has_saved_game with invalid file."""
-        with open(self.state_path, 'w') as f:
+        with open(state_path, 'w') as f:
             f.write("invalid")
         
-        assert not has_saved_game(self.state_path)
+        assert not has_saved_game(state_path)
     
-    def test_create_new_game(self):
+    def test_create_new_game(self, state_path):
         """Test create_new_game function."""
         teams = ["Alpha", "Beta"]
-        game_state = create_new_game(teams, starting_points=20, state_file=self.state_path)
+        game_state = create_new_game(teams, starting_points=20, state_file=state_path)
         
         assert game_state.teams == teams
         assert game_state.get_scores() == {"Alpha": 20, "Beta": 20}
-        assert os.path.exists(self.state_path)
+        assert os.path.exists(state_path)
     
-    def test_load_saved_game(self):
+    def test_load_saved_game(self, state_path):
         """Test load_saved_game function."""
         # Create and save a game
-        original = create_new_game(["Red", "Blue"], state_file=self.state_path)
+        original = create_new_game(["Red", "Blue"], state_file=state_path)
         original.update_scores({"Red": 5}, "Red", "test", "Test")
         
         # Load it back
-        loaded = load_saved_game(self.state_path)
+        loaded = load_saved_game(state_path)
         
         assert loaded is not None
         assert loaded.get_scores()["Red"] == 15  # 10 + 5
         assert len(loaded.events) == 1
     
-    def test_load_saved_game_nonexistent(self):
+    def test_load_saved_game_nonexistent(self, state_path):
         """Test load_saved_game with nonexistent file."""
-        loaded = load_saved_game("nonexistent.json")
+        loaded = load_saved_game(state_path)
         assert loaded is None
\ No newline at end of file
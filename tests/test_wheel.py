@@ -4,11 +4,17 @@ Tests for game/wheel.py module.
 Tests wheel mechanics, outcome processing, and game integration.
 """
 
+import json
+import random
+import sys
 import pytest
 from unittest.mock import patch
 from game.config import GameConfig
 from game.state import create_new_game
-from game.wheel import GameWheel, WheelOutcome, create_wheel, pick_random_starting_team
+from game.wheel import (
+    ADD_FIXED, BAD_VALUE, MYSTERY, NO_OP, STEAL, SWAP_RANDOM,
+    GameWheel, WheelOutcome, create_wheel, pick_random_starting_team
+)
 
 
 class TestWheelOutcome:
@@ -23,47 +29,145 @@ class TestWheelOutcome:
         assert outcome.weight == 3
         assert outcome.score_changes == {}
         assert outcome.description == ""
+        assert not hasattr(outcome, "__dict__")  # Uses __slots__
+    
+    @pytest.mark.parametrize("action,expected", [
+        ("add_fixed:-5", (ADD_FIXED, -5)),
+        ("steal:10", (STEAL, 10)),
+        ("swap_random", (SWAP_RANDOM, 0)),
+        ("bogus:3", (NO_OP, 0)),
+        ("bogus", (MYSTERY, 0)),
+        ("add_fixed:abc", (BAD_VALUE, 0)),
+    ], ids=["add_fixed", "steal", "swap_random", "unknown_with_value", "unknown",
+            "bad_value"])
+    def test_wheel_outcome_parses_action(self, action, expected):
+        """Test that the action string is parsed once into an operation and argument."""
+        outcome = WheelOutcome("Test", action, 1)
+        
+        assert (outcome._op, outcome._arg) == expected
 
 
 class TestGameWheel:
     """Test cases for GameWheel class."""
     
-    def setup_method(self):
-        """Set up test with config and game state."""
-        self.config = GameConfig("test_wheel_config.json")
+    @pytest.fixture(autouse=True)
+    def setup_wheel(self, fresh_config, state_path):
+        """Give each test its own config, Red/Blue/Green game and wheel in tmp_path."""
+        self.config = fresh_config
         self.teams = ["Red", "Blue", "Green"]
-        self.game_state = create_new_game(self.teams, starting_points=20, state_file="test_wheel_state.json")
+        self.game_state = create_new_game(self.teams, starting_points=20,
+                                          state_file=state_path)
         self.wheel = GameWheel(self.config, self.game_state)
     
-    def teardown_method(self):
-        """Clean up test files."""
-        import os
-        for file in ["test_wheel_config.json", "test_wheel_state.json"]:
-            if os.path.exists(file):
-                os.unlink(file)
-    
     def test_wheel_initialization(self):
         """Test wheel initialization."""
         assert self.wheel.config == self.config
         assert self.wheel.game_state == self.game_state
     
-    @patch('random.choices')
-    def test_spin_wheel(self, mock_choices):
+    @patch('random.random', return_value=0.0)
+    @patch('random.randrange', return_value=0)
+    def test_spin_wheel(self, mock_randrange, mock_random):
         """Test wheel spinning mechanism."""
-        # Mock random selection to return first option
-        mock_choices.return_value = [("+5 points", "add_fixed:5", 3)]
-        
+        # Slot 0 with a roll of 0.0 always keeps the first option
         outcome = self.wheel.spin_wheel()
         
         assert outcome.label == "+5 points"
         assert outcome.action == "add_fixed:5"
         assert outcome.weight == 3
         
-        # Verify random.choices was called with weights
-        mock_choices.assert_called_once()
-        args = mock_choices.call_args[0]
-        weights = mock_choices.call_args[1]['weights']
-        assert len(weights) == 10  # Default config has 10 options
+        # One uniform slot pick over all options, then one roll
+        mock_randrange.assert_called_once_with(10)  # Default config has 10 options
+        mock_random.assert_called_once()
+    
+    def test_spin_returns_new_outcome(self):
+        """Test that a later spin never changes an earlier spin's outcome."""
+        other_wheel = GameWheel(self.config, self.game_state)
+        with patch('random.random', return_value=0.0), \
+             patch('random.randrange', return_value=0):
+            first = self.wheel.spin_wheel()
+            self.wheel.process_outcome(first, "Red")
+            second = self.wheel.spin_wheel()
+            self.wheel.process_outcome(second, "Blue")
+            third = other_wheel.spin_wheel()
+        
+        assert second is not first
+        assert third is not first
+        assert first.score_changes == {"Red": 5}
+        assert "Red gains 5 points" in first.description
+        assert second.score_changes == {"Blue": 5}
+    
+    def test_alias_table_matches_weights(self):
+        """Test that the alias table gives each option its share of the weight."""
+        weights = [opt["weight"] for opt in self.config.get_wheel_options()]
+        self.wheel.spin_wheel()  # The table is built on the first spin
+        probs = self.wheel._alias_probs
+        aliases = self.wheel._alias_idx
+        n = len(weights)
+        
+        for i, weight in enumerate(weights):
+            chance = probs[i] + sum(1.0 - probs[j] for j in range(n) if aliases[j] == i)
+            assert chance / n == pytest.approx(weight / sum(weights))
+    
+    def test_alias_table_built_once(self):
+        """Test that spinning reuses the cached options until the config changes."""
+        with patch.object(self.wheel, '_rebuild',
+                          wraps=self.wheel._rebuild) as mock_rebuild:
+            for _ in range(10_000):
+                self.wheel.spin_wheel()
+            mock_rebuild.assert_not_called()
+            
+            self.config.update_wheel_options([
+                {"label": "+5 points", "action": "add_fixed:5", "weight": 1}
+            ])
+            outcome = self.wheel.spin_wheel()
+            
+            mock_rebuild.assert_called_once()
+            assert outcome.label == "+5 points"
+    
+    def test_spin_many(self, monkeypatch):
+        """Test drawing several spins at once from the cumulative weights."""
+        monkeypatch.setitem(sys.modules, "numpy", None)  # As if not installed
+        
+        # Default weights add up to 16; 0.5 * 16 = 8 falls just past the fourth option
+        with patch('random.random', side_effect=[0.0, 0.5, 0.99]):
+            indices = self.wheel.spin_many(3)
+        
+        assert indices == [0, 4, 9]
+        assert self.game_state.get_scores() == {"Red": 20, "Blue": 20, "Green": 20}
+    
+    def test_spin_many_seeded_random(self):
+        """Test that a seeded random.Random gives repeatable spins anywhere."""
+        first = self.wheel.spin_many(1000, rng=random.Random(7))
+        second = self.wheel.spin_many(1000, rng=random.Random(7))
+        
+        assert isinstance(first, list)
+        assert first == second
+        assert set(first) <= set(range(10))  # Default config has 10 options
+    
+    @pytest.mark.parametrize("hide_numpy", [False, True],
+                             ids=["numpy_installed", "numpy_missing"])
+    def test_spin_many_follows_random_seed(self, hide_numpy, monkeypatch):
+        """Test that random.seed() makes spin_many() repeatable, like spin_wheel()."""
+        if hide_numpy:
+            monkeypatch.setitem(sys.modules, "numpy", None)
+        
+        random.seed(7)
+        first = self.wheel.spin_many(1000)
+        random.seed(7)
+        second = self.wheel.spin_many(1000)
+        
+        assert first == second
+    
+    def test_spin_many_numpy(self):
+        """Test that spin_many is repeatable with a seeded numpy Generator."""
+        np = pytest.importorskip("numpy")
+        
+        first = self.wheel.spin_many(1000, rng=np.random.default_rng(7))
+        second = self.wheel.spin_many(1000, rng=np.random.default_rng(7))
+        
+        assert isinstance(first, list)
+        assert first == second
+        assert set(first) <= set(range(10))  # Default config has 10 options
     
     def test_process_add_fixed_positive(self):
         """Test processing positive point addition."""
@@ -101,9 +205,10 @@ class TestGameWheel:
         """Test successful steal action."""
         outcome = WheelOutcome("Steal 5", "steal:5", 2)
         
-        with patch('random.choice', return_value="Blue"):
+        with patch('random.randrange', return_value=0) as mock_randrange:  # Blue
             self.wheel.process_outcome(outcome, "Red")
         
+        mock_randrange.assert_called_once_with(2)  # Blue or Green
         assert outcome.score_changes["Red"] == 5
         assert outcome.score_changes["Blue"] == -5
         assert "Red steals 5 points from Blue" in outcome.description
@@ -129,7 +234,7 @@ class TestGameWheel:
         self.game_state.scores["Blue"] = 3
         outcome = WheelOutcome("Steal 10", "steal:10", 1)
         
-        with patch('random.choice', return_value="Blue"):
+        with patch('random.randrange', return_value=0):  # Blue
             self.wheel.process_outcome(outcome, "Red")
         
         assert outcome.score_changes["Red"] == 3  # Can only steal what's available
@@ -166,11 +271,30 @@ class TestGameWheel:
         outcome = WheelOutcome("Double your score", "multiply:2", 1)
         
         self.wheel.process_outcome(outcome, "Red")
-        
         assert outcome.score_changes == {"Red": 10}  # Capped at 30, so 30 - 20 = 10
         assert "capped at 30" in outcome.description
         assert self.game_state.get_scores()["Red"] == 30
     
+    def test_process_multiply_negative(self):
+        """Test that a negative multiplier is not floored before update_scores."""
+        outcome = WheelOutcome("Flip your score", "multiply:-1", 1)
+        
+        self.wheel.process_outcome(outcome, "Red")
+        
+        assert outcome.score_changes == {"Red": -40}  # -20 - 20
+        assert self.game_state.get_scores()["Red"] == 0  # update_scores floors at 0
+    
+    def test_process_divide_ignores_cap(self):
+        """Test that division is not capped at max_points."""
+        self.config.update_max_points(50)
+        self.game_state.scores["Red"] = 120
+        outcome = WheelOutcome("Halve your score", "divide:2", 1)
+        
+        self.wheel.process_outcome(outcome, "Red")
+        
+        assert outcome.score_changes == {"Red": -60}
+        assert self.game_state.get_scores()["Red"] == 60
+    
     def test_process_divide(self):
         """Test score division."""
         outcome = WheelOutcome("Halve your score", "divide:2", 1)
@@ -186,20 +310,44 @@ class TestGameWheel:
         """Test random score swap."""
         outcome = WheelOutcome("Swap scores", "swap_random", 1)
         
-        with patch('random.choice', return_value="Blue"):
+        with patch('random.randrange', return_value=0) as mock_randrange:  # Blue
             self.wheel.process_outcome(outcome, "Red")
         
+        mock_randrange.assert_called_once_with(2)  # Blue or Green
         # Red and Blue should swap scores (both had 20, so no change)
         assert outcome.score_changes == {"Red": 0, "Blue": 0}
         assert "Red swaps scores with Blue" in outcome.description
     
+    def test_steal_and_swap_follow_new_game(self, tmp_path):
+        """Test that steal and swap pick from the teams of the wheel's current game."""
+        self.wheel.game_state = create_new_game(
+            ["Gold", "Silver"], state_file=str(tmp_path / "other.json"))
+        
+        steal = WheelOutcome("Steal 5", "steal:5", 1)
+        self.wheel.process_outcome(steal, "Gold")
+        swap = WheelOutcome("Swap scores", "swap_random", 1)
+        self.wheel.process_outcome(swap, "Gold")
+        
+        assert steal.score_changes == {"Gold": 5, "Silver": -5}
+        assert "Gold swaps scores with Silver" in swap.description
+    
+    def test_steal_for_team_not_in_game(self):
+        """Test that a team outside the game still steals from every game team."""
+        outcome = WheelOutcome("Steal 5", "steal:5", 1)
+        
+        with patch('random.randrange', return_value=0) as mock_randrange:
+            self.wheel.process_outcome(outcome, "Purple")
+        
+        mock_randrange.assert_called_once_with(3)  # Red, Blue or Green
+        assert outcome.score_changes == {"Purple": 5, "Red": -5}
+    
     def test_process_swap_different_scores(self):
         """Test score swap with different scores."""
         # Give Blue different score
         self.game_state.scores["Blue"] = 15
         outcome = WheelOutcome("Swap scores", "swap_random", 1)
         
-        with patch('random.choice', return_value="Blue"):
+        with patch('random.randrange', return_value=0):  # Blue
             self.wheel.process_outcome(outcome, "Red")
         
         # Red: 20 -> 15 (change: -5), Blue: 15 -> 20 (change: +5)
@@ -218,6 +366,49 @@ class TestGameWheel:
         assert "mini-challenge" in outcome.description
         assert self.game_state.get_scores()["Red"] == 25  # 20 + 5
     
+    def test_malformed_option_does_not_break_wheel(self, fresh_config, state_path):
+        """Test that a bad action value is reported on spin, not when building."""
+        fresh_config.update_wheel_options([
+            {"label": "Broken", "action": "add_fixed:abc", "weight": 1}
+        ])
+        game_state = create_new_game(["Red", "Blue"], state_file=state_path)
+        
+        wheel = create_wheel(fresh_config, game_state)
+        assert "Red" in wheel.get_game_status()
+        
+        with pytest.raises(ValueError, match="'Broken'.*'add_fixed:abc'"):
+            wheel.spin_and_process("Red")
+        assert game_state.get_scores() == {"Red": 10, "Blue": 10}
+    
+    def test_zero_total_weight_only_fails_on_spin(self, fresh_config_path,
+                                                  state_path):
+        """Test that a config whose weights add up to 0 still shows status."""
+        # Config files are not validated on load, unlike update_wheel_options()
+        with open(fresh_config_path, 'w') as f:
+            json.dump({"wheel_options": [
+                {"label": "Nothing", "action": "add_fixed:5", "weight": 0}
+            ]}, f)
+        game_state = create_new_game(["Red", "Blue"], state_file=state_path)
+        
+        wheel = create_wheel(GameConfig(fresh_config_path), game_state)
+        
+        assert "Red" in wheel.get_game_status()
+        with pytest.raises(ValueError, match="greater than zero"):
+            wheel.spin_wheel()
+    
+    def test_process_unknown_actions(self):
+        """Test that unknown actions give a mystery bonus, or nothing with a value."""
+        mystery = WheelOutcome("Mystery", "bogus", 1)
+        no_op = WheelOutcome("Nothing", "bogus:3", 1)
+        
+        self.wheel.process_outcome(mystery, "Red")
+        self.wheel.process_outcome(no_op, "Blue")
+        
+        assert mystery.score_changes == {"Red": 5}
+        assert "mystery bonus" in mystery.description
+        assert no_op.score_changes == {}
+        assert self.game_state.get_scores()["Blue"] == 20
+    
     def test_spin_and_process(self):
         """Test convenience method for spinning and processing."""
         with patch.object(self.wheel, 'spin_wheel') as mock_spin, \
@@ -285,6 +476,45 @@ class TestGameWheel:
         self.game_state.scores["Red"] = 50
         assert self.wheel.is_game_over()
     
+    def test_is_game_over_cached(self):
+        """Test that the scores are only checked again after something changes."""
+        with patch.object(self.wheel, '_check_game_over',
+                          wraps=self.wheel._check_game_over) as mock_check:
+            assert not self.wheel.is_game_over()
+            assert not self.wheel.is_game_over()
+            assert mock_check.call_count == 1
+            
+            self.config.update_max_points(50)
+            self.game_state.scores["Red"] = 50
+            assert self.wheel.is_game_over()
+            assert mock_check.call_count == 2
+    
+    @pytest.mark.parametrize("mutate", [
+        lambda scores: scores.__setitem__("Red", 50),
+        lambda scores: scores.update({"Red": 50}),
+        lambda scores: scores.__ior__({"Red": 50}),  # scores |= {...}
+        lambda scores: scores.setdefault("Purple", 50),
+        lambda scores: scores.pop("Blue"),
+        lambda scores: scores.popitem(),
+        lambda scores: scores.__delitem__("Green"),
+        lambda scores: scores.clear(),
+    ], ids=["setitem", "update", "ior", "setdefault", "pop", "popitem", "delitem",
+            "clear"])
+    def test_score_changes_invalidate_caches(self, mutate):
+        """Test that every way of changing the scores invalidates the wheel's caches."""
+        self.wheel.is_game_over()
+        status = self.wheel.get_game_status()
+        version = self.game_state.version
+        
+        with patch.object(self.wheel, '_check_game_over',
+                          wraps=self.wheel._check_game_over) as mock_check:
+            mutate(self.game_state.scores)
+            self.wheel.is_game_over()
+            
+            mock_check.assert_called_once()
+        assert self.game_state.version != version
+        assert self.wheel.get_game_status() is not status
+    
     def test_is_game_over_no_limits(self):
         """Test game continues when no limits reached."""
         assert not self.wheel.is_game_over()
@@ -297,6 +527,18 @@ class TestGameWheel:
         assert "Round: 1" in status
         assert "GAME OVER" not in status
     
+    def test_get_game_status_cached(self):
+        """Test that the status text is reused until the game changes."""
+        status = self.wheel.get_game_status()
+        
+        assert self.wheel.get_game_status() is status
+        
+        self.wheel.advance_turn()
+        new_status = self.wheel.get_game_status()
+        
+        assert new_status is not status
+        assert "Round: 2" in new_status
+    
     def test_get_game_status_game_over(self):
         """Test game status when game is over."""
         # Set game to be over
@@ -326,29 +568,22 @@ class TestGameWheel:
 class TestUtilityFunctions:
     """Test utility functions."""
     
-    def test_create_wheel(self):
+    def test_create_wheel(self, default_config, state_path):
         """Test create_wheel function."""
-        config = GameConfig("test_config.json")
-        game_state = create_new_game(["Red", "Blue"], state_file="test_state.json")
-        
-        try:
-            wheel = create_wheel(config, game_state)
-            assert isinstance(wheel, GameWheel)
-            assert wheel.config == config
-            assert wheel.game_state == game_state
-        finally:
-            import os
-            for file in ["test_config.json", "test_state.json"]:
-                if os.path.exists(file):
-                    os.unlink(file)
-    
-    @patch('random.choice')
-    def test_pick_random_starting_team(self, mock_choice):
+        game_state = create_new_game(["Red", "Blue"], state_file=state_path)
+        
+        wheel = create_wheel(default_config, game_state)
+        assert isinstance(wheel, GameWheel)
+        assert wheel.config == default_config
+        assert wheel.game_state == game_state
+    
+    @patch('random.randrange')
+    def test_pick_random_starting_team(self, mock_randrange):
         """Test picking random starting team."""
         teams = ["Red", "Blue", "Green"]
-        mock_choice.return_value = "Blue"
+        mock_randrange.return_value = 1
         
         selected = pick_random_starting_team(teams)
         
         assert selected == "Blue"
-        mock_choice.assert_called_once_with(teams)
\ No newline at end of file
+        mock_randrange.assert_called_once_with(len(teams))
\ No newline at end of file